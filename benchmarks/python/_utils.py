@@ -0,0 +1,17 @@
+import pandas
+from pyarrow import csv
+
+
+def parse_stats_file(statsfile, column_types) -> pandas.DataFrame:
+    return csv.read_csv(
+        statsfile,
+        read_options=csv.ReadOptions(column_names=list(column_types)),
+        convert_options=csv.ConvertOptions(column_types=column_types),
+    ).to_pandas()
+
+
+def get_or_none(lst, idx):
+    if idx >= len(lst):
+        return None
+
+    return lst[idx]
@@ -1,22 +1,31 @@
 import sys
 
-import matplotlib.pyplot as plt
-import pandas
-import seaborn
+from _utils import get_or_none, parse_stats_file
 
 
-def parse_stats_file(statsfile) -> pandas.DataFrame:
-    return pandas.read_csv(statsfile, names=["kind", "step", "t"])
+COLUMN_TYPES = {
+    "kind": "string",
+    "step": "int32",
+    "t": "float32",
+}
 
 
 def main(statsfile, bs, outfile=None):
-    df = parse_stats_file(statsfile)
-    plt.figure(figsize=(16, 10))
-    seaborn.lineplot(x="step", y="t", hue="kind", data=df).set(
+    if outfile:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    import seaborn
+
+    df = parse_stats_file(statsfile, COLUMN_TYPES)
+    fig, ax = plt.subplots(figsize=(16, 10))
+    seaborn.lineplot(x="step", y="t", hue="kind", data=df, ax=ax).set(
         title=f"Time per element by batcher, batch_size={bs}", ylabel="µs"
     )
 
-    plt.legend(
+    ax.legend(
         loc="upper center",
         bbox_to_anchor=(0.5, -0.05),
         fancybox=True,
@@ -25,19 +34,13 @@ def main(statsfile, bs, outfile=None):
     )
 
     if outfile:
-        plt.savefig(outfile)
+        fig.savefig(outfile, dpi=72, bbox_inches="tight")
+        plt.close(fig)
 
     else:
         plt.show()
 
 
-def get_or_none(lst, idx):
-    if idx >= len(lst):
-        return None
-
-    return lst[idx]
-
-
 if __name__ == "__main__":
     filename = sys.argv[1]
     bs = sys.argv[2]
@@ -1,16 +1,26 @@
 import sys
 
-import matplotlib.pyplot as plt
-import pandas
-import seaborn
+from _utils import get_or_none, parse_stats_file
 
 
-def parse_stats_file(statsfile) -> pandas.DataFrame:
-    return pandas.read_csv(statsfile, names=["kind", "batchsize", "ms", "stddev"])
+COLUMN_TYPES = {
+    "kind": "string",
+    "batchsize": "int32",
+    "ms": "float32",
+    "stddev": "float32",
+}
 
 
 def main(statsfile, iterations, outfile=None):
-    df = parse_stats_file(statsfile)
+    if outfile:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    import seaborn
+
+    df = parse_stats_file(statsfile, COLUMN_TYPES)
     fig, ax = plt.subplots(nrows=2, figsize=(16, 16))
 
     seaborn.lineplot(x="batchsize", y="ms", hue="kind", data=df, ax=ax[0]).set(
@@ -29,19 +39,13 @@ def main(statsfile, iterations, outfile=None):
     )
 
     if outfile:
-        plt.savefig(outfile)
+        fig.savefig(outfile, dpi=72, bbox_inches="tight")
+        plt.close(fig)
 
     else:
         plt.show()
 
 
-def get_or_none(lst, idx):
-    if idx >= len(lst):
-        return None
-
-    return lst[idx]
-
-
 if __name__ == "__main__":
     filename = sys.argv[1]
     bs = sys.argv[2]
@@ -1,15 +1,10 @@
-import sys
+import importlib.util
 
-has_seaborn = True
-try:
-    import seaborn
-except:
-    has_seaborn = False
-
-missing = []
-
-if not has_seaborn:
-    missing.append("seaborn")
+missing = [
+    package
+    for package in ("seaborn", "pyarrow")
+    if importlib.util.find_spec(package) is None
+]
 
 
 if missing:
@@ -1,24 +1,34 @@
 import sys
 
-import matplotlib.pyplot as plt
-import pandas
-import seaborn
+from _utils import get_or_none, parse_stats_file
 
 
-def parse_stats_file(statsfile) -> pandas.DataFrame:
-    return pandas.read_csv(statsfile, names=["format", "kind", "t", "stddev"])
+COLUMN_TYPES = {
+    "format": "string",
+    "kind": "string",
+    "t": "float32",
+    "stddev": "float32",
+}
 
 
 def main(statsfile, its, outfile=None):
-    df = parse_stats_file(statsfile)
+    if outfile:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    import seaborn
+
+    df = parse_stats_file(statsfile, COLUMN_TYPES)
 
-    plt.figure(figsize=(16, 10))
-    seaborn.barplot(x="kind", y="t", hue="format", data=df).set(
+    fig, ax = plt.subplots(figsize=(16, 10))
+    seaborn.barplot(x="kind", y="t", hue="format", data=df, ax=ax).set(
         title=f"Mean load time by format and kind, its={its}",
         ylabel="milliseconds",
     )
 
-    plt.legend(
+    ax.legend(
         loc="upper center",
         bbox_to_anchor=(0.5, -0.05),
         fancybox=True,
@@ -27,19 +37,13 @@ def main(statsfile, its, outfile=None):
     )
 
     if outfile:
-        plt.savefig(outfile)
+        fig.savefig(outfile, dpi=72, bbox_inches="tight")
+        plt.close(fig)
 
     else:
         plt.show()
 
 
-def get_or_none(lst, idx):
-    if idx >= len(lst):
-        return None
-
-    return lst[idx]
-
-
 if __name__ == "__main__":
     filename = sys.argv[1]
     its = sys.argv[2]
@@ -1,17 +1,22 @@
 import sys
 
-import matplotlib.pyplot as plt
-import pandas
-import seaborn
+from _utils import parse_stats_file
 
 
-def parse_stats_file(statsfile) -> pandas.DataFrame:
-    return pandas.read_csv(statsfile, names=["kind", "step", "t"])
+COLUMN_TYPES = {
+    "kind": "string",
+    "step": "int32",
+    "t": "float32",
+}
 
 
 def main(statsfile, bs):
-    df = parse_stats_file(statsfile)
-    seaborn.lineplot(x="step", y="t", hue="kind", data=df).set(
+    import matplotlib.pyplot as plt
+    import seaborn
+
+    df = parse_stats_file(statsfile, COLUMN_TYPES)
+    _, ax = plt.subplots()
+    seaborn.lineplot(x="step", y="t", hue="kind", data=df, ax=ax).set(
         title=f"Time per element by noise quality, batch_size={bs}", ylabel="µs"
     )
     plt.show()
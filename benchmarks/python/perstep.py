@@ -1,33 +1,37 @@
 import sys
 
-import matplotlib.pyplot as plt
-import pandas
+from _utils import parse_stats_file
 
 
-def parse_stats_file(statsfile) -> pandas.DataFrame:
-    return pandas.read_csv(statsfile, names=["step", "batch_size", "count", "t"])
+COLUMN_TYPES = {
+    "step": "int32",
+    "batch_size": "int32",
+    "count": "int32",
+    "t": "float32",
+}
 
 
 def main(statsfile, bs):
-    data = parse_stats_file(statsfile)
+    import matplotlib.pyplot as plt
+
+    data = parse_stats_file(statsfile, COLUMN_TYPES)
 
     fig, ax = plt.subplots()
 
-    for count in range(1, 11):
-        data.where((data["batch_size"] == bs) & (data["count"] == count)).plot(
-            x="step", y="t", ax=ax, label=f"count={count}"
-        )
+    data = data[(data["batch_size"] == bs) & data["count"].between(1, 10)]
+    for count, group in data.groupby("count"):
+        group.plot(x="step", y="t", ax=ax, label=f"count={count}")
 
     bs = bs if bs > 1 else "off"
-    # adding title to the plot
-    plt.title(f"Time per element (batch={bs})")
-
-    # adding Label to the x-axis
-    plt.ylim(top=1000, bottom=0)
-    plt.xlabel("step")
-    plt.ylabel("us")
+    # adding title, limits and labels to the plot
+    ax.set(
+        title=f"Time per element (batch={bs})",
+        ylim=(0, 1000),
+        xlabel="step",
+        ylabel="us",
+    )
     # adding legend to the curve
-    plt.legend()
+    ax.legend()
 
     plt.show()
 